@@ -23,7 +23,7 @@ class ProjectCreator:
             self._create_directories(dirs)
             self._create_files(files, app_name)
         except Exception as e:
-            logger.error(f"Failed to create project: {e}")
+            logger.error("Failed to create project: %s", e)
             raise
 
     def _setup_structure(self, root_dir: str, app_name: str, interface_groups: List[str], module_groups: List[str]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
@@ -52,7 +52,7 @@ class ProjectCreator:
                 try:
                     self.dir_creator.create(dir)
                 except Exception as e:
-                    logger.error(f"Failed to create directory {dir}: {e}")
+                    logger.error("Failed to create directory %s: %s", dir, e)
                     raise
 
     def _create_files(self, files: Dict[str, List[str]], app_name: str) -> None:
@@ -69,5 +69,5 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'
                 try:
                     self.file_creator.create_with_content(file, comment, content)
                 except Exception as e:
-                    logger.error(f"Failed to create file {file}: {e}")
+                    logger.error("Failed to create file %s: %s", file, e)
                     raise